@@ -4,35 +4,215 @@ Contains the data structure for the chess board itself
 The chess board is responsible for managing piece positions
 
 The board is indexed via row and column indices (row,col), where (0,0) is a1 and (7,7) is h8
+
+Internally, the board keeps one bitboard per piece code (see piece.py). A bitboard is an integer where
+bit number (row * 8 + col) is set when that square holds that kind of piece. Alongside the bitboards,
+`squares` holds the piece code (see piece.py) of every square in one flat bytearray
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 
-from .piece import Piece, PieceColor
+from .piece import (
+    BLACK_BISHOP,
+    BLACK_KING,
+    BLACK_KNIGHT,
+    BLACK_PAWN,
+    BLACK_QUEEN,
+    BLACK_ROOK,
+    EMPTY,
+    PIECES_BY_CODE,
+    WHITE_BISHOP,
+    WHITE_KING,
+    WHITE_KNIGHT,
+    WHITE_PAWN,
+    WHITE_QUEEN,
+    WHITE_ROOK,
+    Piece,
+    PieceColor,
+)
+
+_KING_CODES = (WHITE_KING, BLACK_KING)
+
+
+def create_empty_squares() -> bytearray:
+    """Creates an empty flat array of 64 squares to pass to the board
+
+    :return: A bytearray of 64 piece codes, all EMPTY
+    :rtype: bytearray
+    """
+    return bytearray(64)
 
 
-def create_empty_squares() -> list[list[Piece | None]]:
-    """Creates an empty 8x8 grid to pass to the board
+def create_empty_bitboards() -> list[int]:
+    """Creates the bitboards of an empty board
 
-    :return: An empty 8x8 grid that can be filled with pieces
-    :rtype: list[list[Piece | None]]
+    :return: A list of 13 empty bitboards indexed by piece code (the EMPTY entry is unused)
+    :rtype: list[int]
     """
-    return [[None for _ in range(8)] for _ in range(8)]
+    return [0] * (BLACK_KING + 1)
+
 
+def _bitboard_property(code: int) -> property:
+    return property(
+        lambda self: self.piece_bitboards[code],
+        doc="Bitboard of the squares holding this kind of piece (read-only)",
+    )
 
-@dataclass
+
+@dataclass(slots=True)
 class ChessBoard:
-    squares: list[list[Piece | None]] = field(default_factory=create_empty_squares)
+    # Bitboard of each piece code, indexed by code. Index EMPTY is unused and always 0
+    piece_bitboards: list[int] = field(default_factory=create_empty_bitboards)
+
+    occ_w: int = field(init=False, default=0)
+    occ_b: int = field(init=False, default=0)
+
+    squares: bytearray = field(init=False, default_factory=create_empty_squares)
+
+    # (row,col) of each king, or None if that king is not on the board
+    white_king_sq: tuple[int, int] | None = field(init=False, default=None)
+    black_king_sq: tuple[int, int] | None = field(init=False, default=None)
+
+    pawns_w = _bitboard_property(WHITE_PAWN)
+    rooks_w = _bitboard_property(WHITE_ROOK)
+    knights_w = _bitboard_property(WHITE_KNIGHT)
+    bishops_w = _bitboard_property(WHITE_BISHOP)
+    queens_w = _bitboard_property(WHITE_QUEEN)
+    kings_w = _bitboard_property(WHITE_KING)
+
+    pawns_b = _bitboard_property(BLACK_PAWN)
+    rooks_b = _bitboard_property(BLACK_ROOK)
+    knights_b = _bitboard_property(BLACK_KNIGHT)
+    bishops_b = _bitboard_property(BLACK_BISHOP)
+    queens_b = _bitboard_property(BLACK_QUEEN)
+    kings_b = _bitboard_property(BLACK_KING)
+
+    def __post_init__(self):
+        for code in range(WHITE_PAWN, BLACK_KING + 1):
+            bitboard = self.piece_bitboards[code]
+            while bitboard:
+                lowest_bit = bitboard & -bitboard
+                self.squares[lowest_bit.bit_length() - 1] = code
+                bitboard ^= lowest_bit
+
+        self._update_occupancy()
+        self._update_king_squares()
+
+    @classmethod
+    def _from_parsed(cls, piece_bitboards: list[int], squares: bytearray) -> ChessBoard:
+        """Build a board from bitboards and a square array that the FEN parser built together,
+        skipping the work of filling the squares in again
+
+        :param piece_bitboards: Bitboard of each piece code, indexed by code
+        :type piece_bitboards: list[int]
+        :param squares: Piece code of every square, matching piece_bitboards
+        :type squares: bytearray
+        :return: The board
+        :rtype: ChessBoard
+        """
+        board = cls.__new__(cls)
+        board.piece_bitboards = piece_bitboards
+        board.squares = squares
+        board._update_occupancy()
+        board._update_king_squares()
+        return board
+
+    def _update_occupancy(self):
+        bitboards = self.piece_bitboards
+        occ_w = occ_b = 0
+        for code in range(WHITE_PAWN, WHITE_KING + 1):
+            occ_w |= bitboards[code]
+            occ_b |= bitboards[code - WHITE_PAWN + BLACK_PAWN]
+        self.occ_w = occ_w
+        self.occ_b = occ_b
+
+    def _update_king_squares(self):
+        kings_w = self.piece_bitboards[WHITE_KING]
+        kings_b = self.piece_bitboards[BLACK_KING]
+        self.white_king_sq = divmod(kings_w.bit_length() - 1, 8) if kings_w else None
+        self.black_king_sq = divmod(kings_b.bit_length() - 1, 8) if kings_b else None
+
+    @property
+    def occupied(self) -> int:
+        """Bitboard of every occupied square"""
+        return self.occ_w | self.occ_b
+
+    def bitboards(self) -> tuple[int, ...]:
+        """Get the piece bitboards, ordered by piece code
+
+        :return: A tuple of the 12 piece bitboards
+        :rtype: tuple[int, ...]
+        """
+        return tuple(self.piece_bitboards[WHITE_PAWN:])
+
+    def as_tuple(self) -> tuple[Piece | None, ...]:
+        """Get the piece on every square as one flat tuple
+
+        :return: A tuple of 64 pieces (None for empty squares), indexed by row * 8 + col
+        :rtype: tuple[Piece | None, ...]
+        """
+        return tuple(map(PIECES_BY_CODE.__getitem__, self.squares))
+
+    # get_square, is_empty and in_bounds are conveniences for callers outside the engine.
+    # Hot loops should index `squares` or test the bitboards directly instead of paying for a method call
 
     def get_square(self, row: int, col: int) -> Piece | None:
-        return self.squares[row][col]
+        # Flat row * 8 + col indexing would silently wrap onto another square
+        if not (0 <= row < 8 and 0 <= col < 8):
+            raise IndexError(f"Square index (row={row},col={col}) is not on the board")
+        return PIECES_BY_CODE[self.squares[row * 8 + col]]
 
     def set_piece(self, piece: Piece | None, row: int, col: int):
-        self.squares[row][col] = piece
+        if not (0 <= row < 8 and 0 <= col < 8):
+            raise IndexError(f"Square index (row={row},col={col}) is not on the board")
+        self.set_code(row * 8 + col, EMPTY if piece is None else piece.code)
+
+    def set_code(self, square: int, code: int):
+        """Put a piece code on a square, replacing whatever was there
+
+        The square is not bounds checked, so that the engine can restore squares cheaply
+
+        :param square: Square index (row * 8 + col)
+        :type square: int
+        :param code: Piece code to put on the square (EMPTY to clear it)
+        :type code: int
+        """
+        mask = 1 << square
+        squares = self.squares
+        bitboards = self.piece_bitboards
+
+        old_code = squares[square]
+        if old_code:
+            bitboards[old_code] ^= mask
+            if old_code <= WHITE_KING:
+                self.occ_w ^= mask
+            else:
+                self.occ_b ^= mask
+
+        squares[square] = code
+        if code:
+            bitboards[code] |= mask
+            if code <= WHITE_KING:
+                self.occ_w |= mask
+            else:
+                self.occ_b |= mask
+
+            if code == WHITE_KING:
+                self.white_king_sq = divmod(square, 8)
+            elif code == BLACK_KING:
+                self.black_king_sq = divmod(square, 8)
+        if old_code in _KING_CODES and old_code != code:
+            # A king was removed rather than moved, which shouldn't happen in a legal game
+            self._update_king_squares()
 
     def move_piece(self, start_row: int, start_col: int, end_row: int, end_col: int):
         """Move a piece from a start square to an end square
 
+        The indices are not bounds checked, so that moving stays cheap for the engine.
+        Callers must make sure both squares are on the board (see `in_bounds`)
+
         :param start_row: Row index of the start square
         :type start_row: int
         :param start_col: Column index of the start square
@@ -42,15 +222,35 @@ class ChessBoard:
         :param end_col: Column index of the end square
         :type end_col: int
         """
-        piece = self.squares[start_row][start_col]
-        if piece is not None:
-            self.squares[end_row][end_col] = piece
+        start = start_row * 8 + start_col
+        end = end_row * 8 + end_col
+        squares = self.squares
+        code = squares[start]
+        if not code or start == end:
+            return
+        if squares[end]:
+            self.set_code(end, EMPTY)
+
+        move_mask = (1 << start) | (1 << end)
+        self.piece_bitboards[code] ^= move_mask
+        if code <= WHITE_KING:
+            self.occ_w ^= move_mask
+            if code == WHITE_KING:
+                self.white_king_sq = (end_row, end_col)
+        else:
+            self.occ_b ^= move_mask
+            if code == BLACK_KING:
+                self.black_king_sq = (end_row, end_col)
+        squares[start] = EMPTY
+        squares[end] = code
 
     def is_empty(self, row: int, col: int):
-        return self.squares[row][col] is None
+        if not (0 <= row < 8 and 0 <= col < 8):
+            raise IndexError(f"Square index (row={row},col={col}) is not on the board")
+        return not self.squares[row * 8 + col]
 
     def in_bounds(self, row: int, col: int):
-        return row in range(8) and col in range(8)
+        return 0 <= row < 8 and 0 <= col < 8
 
     def find_king(self, color: PieceColor) -> tuple[int, int]:
         """Find the king's square (of the provided color)
@@ -60,8 +260,4 @@ class ChessBoard:
         :return: A [row,col] tuple representing the king's location
         :rtype: tuple[int, int]
         """
-        for row in range(8):
-            for col in range(8):
-                piece = self.squares[row][col]
-                if piece and piece.is_king() and piece.color == color:
-                    return (row, col)
+        return self.white_king_sq if color == PieceColor.WHITE else self.black_king_sq
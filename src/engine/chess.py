@@ -10,19 +10,41 @@ from dataclasses import dataclass, field
 from typing import Literal
 
 from .board import ChessBoard
-from .piece import PieceColor
-
-
-@dataclass
+from .piece import BLACK_PAWN, EMPTY, WHITE_PAWN, PieceColor
+
+# Castling rights are bit flags combined into ChessGame.castling_rights
+WHITE_KINGSIDE = 1
+WHITE_QUEENSIDE = 2
+BLACK_KINGSIDE = 4
+BLACK_QUEENSIDE = 8
+ALL_CASTLING_RIGHTS = (
+    WHITE_KINGSIDE | WHITE_QUEENSIDE | BLACK_KINGSIDE | BLACK_QUEENSIDE
+)
+
+# Castling rights lost when a piece moves to or from each of these squares (king and rook starting squares)
+_CASTLING_SQUARE_RIGHTS: dict[int, int] = {
+    0: WHITE_QUEENSIDE,  # a1
+    4: WHITE_KINGSIDE | WHITE_QUEENSIDE,  # e1
+    7: WHITE_KINGSIDE,  # h1
+    56: BLACK_QUEENSIDE,  # a8
+    60: BLACK_KINGSIDE | BLACK_QUEENSIDE,  # e8
+    63: BLACK_KINGSIDE,  # h8
+}
+
+# Castling rights that survive a move to or from each square, indexed by row * 8 + col
+_CASTLING_RIGHTS_KEPT: tuple[int, ...] = tuple(
+    ALL_CASTLING_RIGHTS & ~_CASTLING_SQUARE_RIGHTS.get(square, 0)
+    for square in range(64)
+)
+
+
+@dataclass(slots=True)
 class ChessGame:
     board: ChessBoard = field(default_factory=ChessBoard)
 
     active_color: PieceColor = PieceColor.WHITE
 
-    white_castle_kingside: bool = True
-    white_castle_queenside: bool = True
-    black_castle_kingside: bool = True
-    black_castle_queenside: bool = True
+    castling_rights: int = ALL_CASTLING_RIGHTS
 
     en_passant_square: tuple[int, int] | None = None
 
@@ -31,6 +53,13 @@ class ChessGame:
 
     __legal_moves: list[str] = field(default_factory=list)
 
+    # One packed int per move made, holding what undo_move needs to restore. Bits, from lowest:
+    # start square (6), end square (6), moving piece code (4), captured piece code (4),
+    # castling rights (4), en passant square + 1 or 0 for none (7), halfmove counter (remaining bits)
+    __undo_stack: list[int] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
     def make_move(self, move: str) -> bool:
         """Make a move in the game
 
@@ -41,6 +70,61 @@ class ChessGame:
         """
         pass
 
+    def apply_move(self, start_row: int, start_col: int, end_row: int, end_col: int):
+        """Move a piece and update the game state, without checking that the move is legal
+
+        Castling rook moves, en passant captures and promotions are not handled yet
+
+        :param start_row: Row index of the start square
+        :type start_row: int
+        :param start_col: Column index of the start square
+        :type start_col: int
+        :param end_row: Row index of the end square
+        :type end_row: int
+        :param end_col: Column index of the end square
+        :type end_col: int
+        """
+        start = start_row * 8 + start_col
+        end = end_row * 8 + end_col
+        moving = self.board.squares[start]
+        captured = self.board.squares[end]
+
+        en_passant = 0
+        if self.en_passant_square is not None:
+            en_passant = self.en_passant_square[0] * 8 + self.en_passant_square[1] + 1
+        self.__undo_stack.append(
+            start
+            | end << 6
+            | moving << 12
+            | captured << 16
+            | self.castling_rights << 20
+            | en_passant << 24
+            | self.halfmove_counter << 31
+        )
+
+        self.board.move_piece(start_row, start_col, end_row, end_col)
+
+        self.castling_rights &= (
+            _CASTLING_RIGHTS_KEPT[start] & _CASTLING_RIGHTS_KEPT[end]
+        )
+
+        is_pawn = moving == WHITE_PAWN or moving == BLACK_PAWN
+        if is_pawn and abs(end_row - start_row) == 2:
+            self.en_passant_square = ((start_row + end_row) // 2, start_col)
+        else:
+            self.en_passant_square = None
+
+        if is_pawn or captured != EMPTY:
+            self.halfmove_counter = 0
+        else:
+            self.halfmove_counter += 1
+
+        if self.active_color == PieceColor.WHITE:
+            self.active_color = PieceColor.BLACK
+        else:
+            self.active_color = PieceColor.WHITE
+            self.fullmove_counter += 1
+
     def legal_moves(self) -> list[str]:
         """Return a list of all current legal moves
 
@@ -90,5 +174,22 @@ class ChessGame:
         pass
 
     def undo_move(self):
-        """Undoes the previous move"""
-        pass
+        """Undoes the previous move. Does nothing if no moves have been made"""
+        if not self.__undo_stack:
+            return
+        packed = self.__undo_stack.pop()
+
+        # Restore both squares as they were, which also covers a "move" from an empty square
+        self.board.set_code(packed & 63, packed >> 12 & 15)
+        self.board.set_code(packed >> 6 & 63, packed >> 16 & 15)
+
+        self.castling_rights = packed >> 20 & 15
+        en_passant = packed >> 24 & 127
+        self.en_passant_square = divmod(en_passant - 1, 8) if en_passant else None
+        self.halfmove_counter = packed >> 31
+
+        if self.active_color == PieceColor.WHITE:
+            self.active_color = PieceColor.BLACK
+            self.fullmove_counter -= 1
+        else:
+            self.active_color = PieceColor.WHITE
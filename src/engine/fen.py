@@ -4,21 +4,86 @@ Contains FEN (Forsyth-Edwards Notation) related utilities such as parsers and va
 
 import re
 
-from .board import ChessBoard
-from .chess import ChessGame
+from .board import ChessBoard, create_empty_bitboards, create_empty_squares
+from .chess import (
+    BLACK_KINGSIDE,
+    BLACK_QUEENSIDE,
+    WHITE_KINGSIDE,
+    WHITE_QUEENSIDE,
+    ChessGame,
+)
 from .move import squarename_to_index
-from .piece import Piece, PieceColor, PieceType
+from .piece import (
+    BLACK_KING,
+    BLACK_PAWN,
+    BLACK_ROOK,
+    CODE_PIECES,
+    WHITE_KING,
+    WHITE_PAWN,
+    WHITE_ROOK,
+    Piece,
+    PieceColor,
+    PieceType,
+)
 
 STARTING_FEN_SHORT = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR"
 STARTING_FEN_LONG = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
 
+# FEN symbol (lowercase) of each piece type, indexed by PieceType
+_PIECETYPE_FEN_SYMBOLS = ("p", "r", "n", "b", "q", "k")
+
 FEN_PIECETYPE_MAP: dict[str, PieceType] = {
-    "p": PieceType.PAWN,
-    "r": PieceType.ROOK,
-    "n": PieceType.KNIGHT,
-    "b": PieceType.BISHOP,
-    "q": PieceType.QUEEN,
-    "k": PieceType.KING,
+    symbol: PieceType(piece_type)
+    for piece_type, symbol in enumerate(_PIECETYPE_FEN_SYMBOLS)
+}
+
+# FEN symbol of each piece code, indexed by code - 1
+_CODE_SYMBOLS = "".join(
+    _PIECETYPE_FEN_SYMBOLS[piece_type].upper()
+    if color == PieceColor.WHITE
+    else _PIECETYPE_FEN_SYMBOLS[piece_type]
+    for piece_type, color in CODE_PIECES
+).encode()
+
+# Piece code of each FEN piece symbol, indexed by the symbol's byte value (EMPTY for non-piece bytes)
+_SYM_TO_CODE = bytes(_CODE_SYMBOLS.find(byte) + 1 for byte in range(256))
+
+# Shared piece instance for each FEN piece symbol
+_FEN_PIECES: dict[str, Piece] = {
+    chr(symbol): Piece.from_code(code)
+    for code, symbol in enumerate(_CODE_SYMBOLS, start=1)
+}
+
+# Lookup table from a byte of a piece placement FEN to how _parse_placement handles it:
+# a piece code (1-12), a negative count of empty squares to skip,
+# _FEN_SLASH for a rank separator, or _FEN_INVALID for anything else
+_FEN_SLASH = 13
+_FEN_INVALID = 0
+_FEN_DISPATCH: list[int] = list(_SYM_TO_CODE)
+for _skip, _digit in enumerate(b"12345678", start=1):
+    _FEN_DISPATCH[_digit] = -_skip
+_FEN_DISPATCH[ord("/")] = _FEN_SLASH
+del _skip, _digit
+
+# Matches the format of all 6 FEN fields, capturing each field
+_FEN_RE = re.compile(
+    r"([prnbqkPRNBQK1-8/]+) ([wb]) (-|[KQkq]+) (-|[a-h][36]) (\d+) (\d+)"
+)
+
+# For each castling flag: (king code, king square, rook code, rook square), squares indexed by row * 8 + col
+_CASTLING_SQUARES: dict[str, tuple[int, int, int, int]] = {
+    "K": (WHITE_KING, 4, WHITE_ROOK, 7),
+    "Q": (WHITE_KING, 4, WHITE_ROOK, 0),
+    "k": (BLACK_KING, 60, BLACK_ROOK, 63),
+    "q": (BLACK_KING, 60, BLACK_ROOK, 56),
+}
+
+# Castling right for each flag of the castling rights field
+_FEN_CASTLING_RIGHTS: dict[str, int] = {
+    "K": WHITE_KINGSIDE,
+    "Q": WHITE_QUEENSIDE,
+    "k": BLACK_KINGSIDE,
+    "q": BLACK_QUEENSIDE,
 }
 
 
@@ -32,6 +97,21 @@ class InvalidFENError(Exception):
         super().__init__(self.message)
 
 
+def is_valid_placement_fen(piece_placement: str) -> bool:
+    """Validates the piece placement field of a FEN string (format rule 2 of `is_valid_fen`)
+
+    :param piece_placement: FEN string consisting **only** of the piece placement field
+    :type piece_placement: str
+    :return: Whether the piece placement has 8 rows of 8 squares using only valid characters
+    :rtype: bool
+    """
+    try:
+        _parse_placement(piece_placement)
+    except InvalidFENError:
+        return False
+    return True
+
+
 def is_valid_fen(fen: str) -> bool:
     """Fully validates a FEN string (for all practical purposes) based on the following rules:
 
@@ -60,104 +140,71 @@ def is_valid_fen(fen: str) -> bool:
     :rtype: bool
     """
     try:
-        parts = fen.strip().split()
-        if len(parts) != 6:
-            return False
-
-        (
-            piece_placement,
-            active_color,
-            castling_rights,
-            en_passant,
-            halfmove_clock,
-            fullmove_number,
-        ) = parts
-
-        if not re.match(r"^[prnbqkPRNBQK1-8/]+$", piece_placement):
-            return False
-
-        if active_color not in ("w", "b"):
-            return False
+        _parse_fen(fen)
+    except Exception:
+        return False
+    return True
 
-        if castling_rights != "-" and not re.match(r"^[KQkq]+$", castling_rights):
-            return False
 
-        if en_passant != "-" and not re.match(r"^[a-h][36]$", en_passant):
-            return False
+def _parse_fen(fen: str) -> tuple[list[int], bytearray, tuple[str, ...]]:
+    """Validate a full FEN string (see `is_valid_fen`) while parsing its piece placement only once
 
-        if not halfmove_clock.isdigit() or not fullmove_number.isdigit():
-            return False
+    :param fen: A FEN string consisting of all 6 fields
+    :type fen: str
+    :raises InvalidFENError: If the FEN is not valid
+    :return: The piece bitboards, the piece code of every square, and the 6 FEN fields
+    :rtype: tuple[list[int], bytearray, tuple[str, ...]]
+    """
+    match = _FEN_RE.fullmatch(fen.strip())
+    if not match:
+        raise InvalidFENError(fen, "Fields are missing or badly formatted")
 
-        # Create board using new coordinate logic: row 0 = rank 1, row 7 = rank 8
-        board = [["" for _ in range(8)] for _ in range(8)]
-        rows = piece_placement.split("/")
-        if len(rows) != 8:
-            return False
+    fields = match.groups()
+    bitboards, squares = _parse_placement(fields[0])
+    if not _is_valid_position(squares, fields[1], fields[2], fields[3]):
+        raise InvalidFENError(
+            fen, "Position breaks a king, castling or en passant rule"
+        )
+    return bitboards, squares, fields
+
+
+def _is_valid_position(
+    squares: bytearray, active_color: str, castling_rights: str, en_passant: str
+) -> bool:
+    """Checks the "semantic" rules of `is_valid_fen` against a board's flat array of piece codes
+
+    :param squares: The 64 piece codes of the board, indexed by row * 8 + col
+    :type squares: bytearray
+    :param active_color: Active color field ('w' or 'b')
+    :type active_color: str
+    :param castling_rights: Castling rights field
+    :type castling_rights: str
+    :param en_passant: En passant square field ('-' or a square on rank 3 or 6)
+    :type en_passant: str
+    :return: Whether the position satisfies the semantic rules
+    :rtype: bool
+    """
+    if squares.count(WHITE_KING) != 1 or squares.count(BLACK_KING) != 1:
+        return False
 
-        for fen_row_index, row in enumerate(rows):
-            board_row = 7 - fen_row_index  # Rank 8 is row 7, Rank 1 is row 0
-            col = 0
-            for ch in row:
-                if ch.isdigit():
-                    col += int(ch)
-                elif ch in "prnbqkPRNBQK":
-                    if col >= 8:
-                        return False
-                    board[board_row][col] = ch
-                    col += 1
-                else:
-                    return False
-            if col != 8:
+    if castling_rights != "-":
+        for flag in castling_rights:
+            king, king_square, rook, rook_square = _CASTLING_SQUARES[flag]
+            if squares[king_square] != king or squares[rook_square] != rook:
                 return False
 
-        # Count kings
-        white_kings = sum(row.count("K") for row in board)
-        black_kings = sum(row.count("k") for row in board)
-        if white_kings != 1 or black_kings != 1:
-            return False
-
-        # Correct castling square mappings in new coordinate system
-        king_positions = {"K": (0, 4), "Q": (0, 4), "k": (7, 4), "q": (7, 4)}
-        rook_positions = {"K": (0, 7), "Q": (0, 0), "k": (7, 7), "q": (7, 0)}
-
-        if castling_rights != "-":
-            for flag in castling_rights:
-                if flag not in "KQkq":
-                    return False
-
-                k_row, k_col = king_positions[flag]
-                r_row, r_col = rook_positions[flag]
-                expected_king = "K" if flag.isupper() else "k"
-                expected_rook = "R" if flag.isupper() else "r"
-
-                if (
-                    board[k_row][k_col] != expected_king
-                    or board[r_row][r_col] != expected_rook
-                ):
-                    return False
-
-        if en_passant != "-":
-            file = ord(en_passant[0]) - ord("a")
-            rank = int(en_passant[1])
-            row = rank - 1  # Rank 1 = row 0
-
-            if active_color == "w":
-                # White to move → Black must have just double-pushed
-                # Look for black pawn on rank 5 that moved from rank 7
-                if rank != 6 or board[row][file] != "p":
-                    return False
-            elif active_color == "b":
-                # Black to move → White must have just double-pushed
-                # Look for white pawn on rank 4 that moved from rank 2
-                if rank != 3 or board[row][file] != "P":
-                    return False
-            else:
+    if en_passant != "-":
+        # The format check guarantees a file a-h and a rank of 3 or 6
+        square = (ord(en_passant[1]) - 49) * 8 + ord(en_passant[0]) - 97
+        if active_color == "w":
+            # White to move → Black must have just double-pushed
+            if en_passant[1] != "6" or squares[square] != BLACK_PAWN:
                 return False
+        elif en_passant[1] != "3" or squares[square] != WHITE_PAWN:
+            # Black to move → White must have just double-pushed
+            return False
 
-        return True
-
-    except Exception:
-        return False
+    return True
 
 
 def piece_from_fen(fen_symbol: str) -> Piece:
@@ -170,9 +217,7 @@ def piece_from_fen(fen_symbol: str) -> Piece:
     :rtype: Piece
     """
     try:
-        color = PieceColor.WHITE if fen_symbol.isupper() else PieceColor.BLACK
-        piece_type = FEN_PIECETYPE_MAP[fen_symbol.lower()]
-        return Piece(piece_type, color)
+        return _FEN_PIECES[fen_symbol]
     except KeyError:
         raise InvalidFENError(
             fen_symbol,
@@ -180,27 +225,64 @@ def piece_from_fen(fen_symbol: str) -> Piece:
         )
 
 
+def _parse_placement(piece_placement_fen: str) -> tuple[list[int], bytearray]:
+    """Validate the piece placement field of a FEN string while building its bitboards and square array, in a single pass
+
+    :param piece_placement_fen: FEN string consisting **only** of the piece placement field
+    :type piece_placement_fen: str
+    :raises InvalidFENError: If the piece placement is not valid
+    :return: The piece bitboards indexed by piece code, and the piece code of every square
+    :rtype: tuple[list[int], bytearray]
+    """
+    bitboards = create_empty_bitboards()
+    squares = create_empty_squares()
+    row_start, col = 56, 0  # a8
+    for byte in piece_placement_fen.encode():
+        action = _FEN_DISPATCH[byte]
+        if action < 0:
+            col -= action
+            if col > 8:
+                raise InvalidFENError(
+                    piece_placement_fen, "A row has more than 8 squares"
+                )
+        elif action == _FEN_INVALID:
+            raise InvalidFENError(
+                piece_placement_fen,
+                "Only piece symbols (prnbqkPRNBQK), digits 1-8 and '/' are allowed",
+            )
+        elif action < _FEN_SLASH:
+            if col >= 8:
+                raise InvalidFENError(
+                    piece_placement_fen, "A row has more than 8 squares"
+                )
+            bitboards[action] |= 1 << (row_start + col)
+            squares[row_start + col] = action
+            col += 1
+        else:
+            if col != 8:
+                raise InvalidFENError(
+                    piece_placement_fen, "A row has fewer than 8 squares"
+                )
+            row_start -= 8
+            col = 0
+            if row_start < 0:
+                raise InvalidFENError(piece_placement_fen, "There are more than 8 rows")
+
+    if row_start != 0 or col != 8:
+        raise InvalidFENError(piece_placement_fen, "There are fewer than 8 full rows")
+    return bitboards, squares
+
+
 def board_from_fen(piece_placement_fen: str) -> ChessBoard:
-    """Create a board from the piece placement field of a FEN string with the ASSUMPTION that it is valid
+    """Create a board from the piece placement field of a FEN string
 
     :param piece_placement_fen: FEN string consisting **only** of the piece placement field
     :type piece_placement_fen: str
+    :raises InvalidFENError: If the piece placement is not valid
     :return: The board object corresponding to the provided FEN
     :rtype: ChessBoard
     """
-
-    board = ChessBoard()
-    row, col = 7, 0
-    for c in piece_placement_fen:
-        if c == "/":
-            row -= 1
-            col = 0
-        elif c.isdigit():
-            col += int(c)
-        else:
-            board.set_piece(piece_from_fen(c), row, col)
-            col += 1
-    return board
+    return ChessBoard._from_parsed(*_parse_placement(piece_placement_fen))
 
 
 def game_from_fen(fen: str) -> ChessGame:
@@ -212,20 +294,16 @@ def game_from_fen(fen: str) -> ChessGame:
     :return: A chess game instance loaded from the FEN
     :rtype: ChessGame
     """
-    if not is_valid_fen(fen):
-        raise InvalidFENError(fen, "FEN cannot be used to create game")
-
-    game = ChessGame()
-    fields = fen.split(" ")
+    bitboards, squares, fields = _parse_fen(fen)
 
-    game.board = board_from_fen(fields[0])
+    game = ChessGame(board=ChessBoard._from_parsed(bitboards, squares))
 
     game.active_color = PieceColor.WHITE if fields[1] == "w" else PieceColor.BLACK
 
-    game.white_castle_kingside = "K" in fields[2]
-    game.white_castle_queenside = "Q" in fields[2]
-    game.black_castle_kingside = "k" in fields[2]
-    game.black_castle_queenside = "q" in fields[2]
+    castling_rights = 0
+    for flag in fields[2]:
+        castling_rights |= _FEN_CASTLING_RIGHTS.get(flag, 0)
+    game.castling_rights = castling_rights
 
     game.en_passant_square = (
         None if fields[3] == "-" else squarename_to_index(fields[3])
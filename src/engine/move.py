@@ -10,6 +10,19 @@ class NotationError(Exception):
         super().__init__(message)
 
 
+# Name of every square, indexed by row * 8 + col
+_SQUARENAMES: tuple[str, ...] = tuple(
+    f"{file}{rank}" for rank in "12345678" for file in "abcdefgh"
+)
+
+# (row,col) of every square name, in both lower and uppercase
+_SQUARENAME_INDICES: dict[str, tuple[int, int]] = {
+    name: divmod(index, 8)
+    for index, lower_name in enumerate(_SQUARENAMES)
+    for name in (lower_name, lower_name.upper())
+}
+
+
 def is_valid_square(row: int, col: int) -> bool:
     """Validates square indices
 
@@ -20,20 +33,18 @@ def is_valid_square(row: int, col: int) -> bool:
     :return: Whether the square index is valid
     :rtype: bool
     """
-    return row in range(8) and col in range(8)
+    return 0 <= row < 8 and 0 <= col < 8
 
 
-def is_valid_squarename(square_name: str) -> str:
+def is_valid_squarename(square_name: str) -> bool:
     """Validates square names
 
     :param square_name: Square name. Should be between 'a1' and 'h8'
     :type square_name: str
     :return: Whether the square name is valid
-    :rtype: str
+    :rtype: bool
     """
-    if len(square_name) != 2:
-        return False
-    return square_name[0].lower() in "abcdefgh" and square_name[1] in "12345678"
+    return square_name in _SQUARENAME_INDICES
 
 
 def squarename_to_index(square_name: str) -> tuple[int, int]:
@@ -47,13 +58,13 @@ def squarename_to_index(square_name: str) -> tuple[int, int]:
     :return: A tuple of the format (row,col) describing indices to access the square in the board
     :rtype: tuple[int, int]
     """
-    if not is_valid_squarename(square_name):
+    try:
+        return _SQUARENAME_INDICES[square_name]
+    except KeyError:
         raise NotationError(
             f"Square name '{square_name}' must be in format 'a1' through 'h8'"
         )
 
-    return int(square_name[1]) - 1, "abcdefgh".find(square_name[0].lower())
-
 
 def index_to_squarename(row: int, col: int) -> str:
     """Converts board indices to a square name
@@ -69,4 +80,4 @@ def index_to_squarename(row: int, col: int) -> str:
         raise NotationError(
             f"Square index (row={row},col={col}) cannot be converted to square name"
         )
-    return f"{'abcdefgh'[col]}{row + 1}"
+    return _SQUARENAMES[row * 8 + col]
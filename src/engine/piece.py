@@ -1,7 +1,7 @@
 """
 Contains data structures defining pieces in chess
 
-This includes piece types, colors, and the piece class
+This includes piece types, colors, the piece class, and the integer piece codes used by the board
 
 Pieces do not manage their own position. That is the board's job
 """
@@ -9,28 +9,74 @@ Pieces do not manage their own position. That is the board's job
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
 
-class PieceType(Enum):
-    PAWN = "p"
-    ROOK = "r"
-    KNIGHT = "n"
-    BISHOP = "b"
-    QUEEN = "q"
-    KING = "k"
+class PieceType(IntEnum):
+    PAWN = 0
+    ROOK = 1
+    KNIGHT = 2
+    BISHOP = 3
+    QUEEN = 4
+    KING = 5
 
 
-class PieceColor(Enum):
-    WHITE = "w"
-    BLACK = "b"
+class PieceColor(IntEnum):
+    WHITE = 0
+    BLACK = 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Piece:
     type: PieceType
     color: PieceColor
-    has_moved: bool = False
+
+    @staticmethod
+    def from_code(code: int) -> Piece:
+        """Get the piece for a piece code
+
+        Pieces are immutable, so the same shared instance is returned for every call with the same code
+
+        :param code: Piece code between WHITE_PAWN (1) and BLACK_KING (12)
+        :type code: int
+        :raises ValueError: If the code is not a piece code (including EMPTY)
+        :return: The piece corresponding to the code
+        :rtype: Piece
+        """
+        if not WHITE_PAWN <= code <= BLACK_KING:
+            raise ValueError(f"{code} is not a piece code")
+        return PIECES_BY_CODE[code]
+
+    @property
+    def code(self) -> int:
+        """The piece code for this piece's type and color"""
+        return self.color * 6 + self.type + 1
 
     def is_king(self) -> bool:
-        return self.type.value.lower() == "k"
+        return self.type == PieceType.KING
+
+
+# Pieces are stored on the board as small integer codes, with 0 meaning an empty square
+EMPTY = 0
+WHITE_PAWN = 1
+WHITE_ROOK = 2
+WHITE_KNIGHT = 3
+WHITE_BISHOP = 4
+WHITE_QUEEN = 5
+WHITE_KING = 6
+BLACK_PAWN = 7
+BLACK_ROOK = 8
+BLACK_KNIGHT = 9
+BLACK_BISHOP = 10
+BLACK_QUEEN = 11
+BLACK_KING = 12
+
+# (type, color) of each piece code, indexed by code - 1
+CODE_PIECES: tuple[tuple[PieceType, PieceColor], ...] = tuple(
+    (piece_type, color) for color in PieceColor for piece_type in PieceType
+)
+
+# One shared instance of each piece, indexed by code, with None for EMPTY
+PIECES_BY_CODE: tuple[Piece | None, ...] = (None,) + tuple(
+    Piece(piece_type, color) for piece_type, color in CODE_PIECES
+)
@@ -1,13 +1,112 @@
-from src.engine.board import ChessBoard, create_empty_squares
+import pytest
 
-
-def test_create_empty_squares():
-    empty = [[None for _ in range(8)] for _ in range(8)]
-    assert empty == create_empty_squares()
+from src.engine.board import ChessBoard, create_empty_bitboards, create_empty_squares
+from src.engine.piece import (
+    BLACK_KING,
+    BLACK_KNIGHT,
+    EMPTY,
+    WHITE_KING,
+    WHITE_QUEEN,
+    Piece,
+    PieceColor,
+    PieceType,
+)
 
 
 def test_construct():
-    # Test that ChessBoard is using create_empty_squares as a default factory
+    # Test that a default ChessBoard starts with no pieces on it
     empty_board = ChessBoard()
-    empty_squares = create_empty_squares()
-    assert empty_board.squares == empty_squares
+    assert empty_board.bitboards() == (0,) * 12
+    assert empty_board.occupied == 0
+    assert empty_board.squares == create_empty_squares()
+
+
+def test_squares_from_bitboards():
+    # Test that the square array is filled in from the bitboards passed to the board
+    bitboards = create_empty_bitboards()
+    bitboards[WHITE_QUEEN] = 1 << 3
+    bitboards[BLACK_KNIGHT] = 1 << 62
+    board = ChessBoard(bitboards)
+    assert board.squares[3] == WHITE_QUEEN
+    assert board.squares[62] == BLACK_KNIGHT
+    assert board.squares.count(EMPTY) == 62
+
+
+def test_set_piece():
+    board = ChessBoard()
+    board.set_piece(Piece(PieceType.QUEEN, PieceColor.WHITE), 3, 4)
+    assert board.queens_w == 1 << (3 * 8 + 4)
+    assert board.occ_w == board.queens_w
+    assert not board.is_empty(3, 4)
+    assert board.get_square(3, 4) == Piece(PieceType.QUEEN, PieceColor.WHITE)
+    assert board.as_tuple()[3 * 8 + 4] == Piece(PieceType.QUEEN, PieceColor.WHITE)
+    assert board.as_tuple().count(None) == 63
+
+    # Replacing a piece clears it from its old bitboard
+    board.set_piece(Piece(PieceType.KNIGHT, PieceColor.BLACK), 3, 4)
+    assert board.queens_w == 0
+    assert board.occ_w == 0
+    assert board.knights_b == board.occ_b == 1 << (3 * 8 + 4)
+
+    board.set_piece(None, 3, 4)
+    assert board.is_empty(3, 4)
+    assert board.get_square(3, 4) is None
+    assert board.occupied == 0
+
+
+def test_find_king():
+    board = ChessBoard()
+    assert board.find_king(PieceColor.WHITE) is None
+
+    board.set_piece(Piece(PieceType.KING, PieceColor.WHITE), 0, 4)
+    board.set_piece(Piece(PieceType.KING, PieceColor.BLACK), 7, 4)
+    assert board.find_king(PieceColor.WHITE) == (0, 4)
+    assert board.find_king(PieceColor.BLACK) == (7, 4)
+
+    # Capturing a king removes it
+    board.set_piece(Piece(PieceType.QUEEN, PieceColor.WHITE), 7, 4)
+    assert board.find_king(PieceColor.BLACK) is None
+    assert board.find_king(PieceColor.WHITE) == (0, 4)
+
+    # Kings passed in as bitboards are found too
+    bitboards = create_empty_bitboards()
+    bitboards[WHITE_KING] = 1 << 6
+    bitboards[BLACK_KING] = 1 << 62
+    board = ChessBoard(bitboards)
+    assert board.find_king(PieceColor.WHITE) == (0, 6)
+    assert board.find_king(PieceColor.BLACK) == (7, 6)
+
+
+def test_move_piece():
+    board = ChessBoard()
+    board.set_piece(Piece(PieceType.KING, PieceColor.WHITE), 0, 4)
+    board.move_piece(0, 4, 1, 5)
+    assert board.is_empty(0, 4)
+    assert board.get_square(1, 5) == Piece(PieceType.KING, PieceColor.WHITE)
+    assert board.kings_w == board.occupied == 1 << (1 * 8 + 5)
+    assert board.white_king_sq == (1, 5)
+    assert board.find_king(PieceColor.WHITE) == (1, 5)
+
+
+def test_move_piece_capture():
+    board = ChessBoard()
+    board.set_piece(Piece(PieceType.ROOK, PieceColor.WHITE), 0, 0)
+    board.set_piece(Piece(PieceType.KNIGHT, PieceColor.BLACK), 7, 0)
+    board.move_piece(0, 0, 7, 0)
+    assert board.get_square(7, 0) == Piece(PieceType.ROOK, PieceColor.WHITE)
+    assert board.rooks_w == board.occ_w == 1 << 56
+    assert board.knights_b == board.occ_b == 0
+    assert board.squares.count(EMPTY) == 63
+
+
+@pytest.mark.parametrize("row,col", [(0, 8), (8, 0), (-1, 0), (0, -1)])
+def test_out_of_bounds(row, col):
+    board = ChessBoard()
+    piece = Piece(PieceType.PAWN, PieceColor.WHITE)
+    with pytest.raises(IndexError):
+        board.get_square(row, col)
+    with pytest.raises(IndexError):
+        board.set_piece(piece, row, col)
+    with pytest.raises(IndexError):
+        board.is_empty(row, col)
+    assert board.occupied == 0
@@ -0,0 +1,78 @@
+from src.engine.chess import (
+    BLACK_KINGSIDE,
+    WHITE_KINGSIDE,
+    WHITE_QUEENSIDE,
+)
+from src.engine.fen import STARTING_FEN_LONG, game_from_fen
+from src.engine.piece import Piece, PieceColor, PieceType
+
+
+def test_apply_move():
+    game = game_from_fen(STARTING_FEN_LONG)
+
+    # e2-e4
+    game.apply_move(1, 4, 3, 4)
+    assert game.board.is_empty(1, 4)
+    assert game.board.get_square(3, 4) == Piece(PieceType.PAWN, PieceColor.WHITE)
+    assert game.active_color == PieceColor.BLACK
+    assert game.en_passant_square == (2, 4)  # e3
+    assert game.halfmove_counter == 0
+    assert game.fullmove_counter == 1
+
+    # g8-f6
+    game.apply_move(7, 6, 5, 5)
+    assert game.active_color == PieceColor.WHITE
+    assert game.en_passant_square is None
+    assert game.halfmove_counter == 1
+    assert game.fullmove_counter == 2
+
+
+def test_apply_move_castling_rights():
+    game = game_from_fen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+
+    # Rook takes rook on h8, losing white kingside and black kingside castling
+    game.apply_move(0, 7, 7, 7)
+    assert game.castling_rights & WHITE_KINGSIDE == 0
+    assert game.castling_rights & BLACK_KINGSIDE == 0
+    assert game.castling_rights & WHITE_QUEENSIDE
+    assert game.halfmove_counter == 0
+
+    # Moving the king loses all of that side's castling rights
+    game.apply_move(7, 4, 7, 5)
+    assert game.castling_rights == WHITE_QUEENSIDE
+
+
+def test_undo_move():
+    fen = "r3k2r/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 5 10"
+    original = game_from_fen(fen)
+    game = game_from_fen(fen)
+
+    game.apply_move(1, 3, 3, 3)  # d2-d4
+    game.apply_move(7, 7, 7, 5)  # h8-f8
+    game.apply_move(3, 3, 4, 3)  # d4-d5
+    game.apply_move(6, 4, 5, 4)  # e7-e6
+    game.apply_move(4, 3, 5, 4)  # d5xe6
+    assert game.board.get_square(5, 4) == Piece(PieceType.PAWN, PieceColor.WHITE)
+    for _ in range(5):
+        game.undo_move()
+    assert game == original
+
+    # Undoing with no moves made does nothing
+    game.undo_move()
+    assert game == original
+
+    # Undoing a move from an empty square restores both squares
+    original = game_from_fen(STARTING_FEN_LONG)
+    game = game_from_fen(STARTING_FEN_LONG)
+    game.apply_move(3, 3, 6, 3)  # d4-d7, d4 is empty
+    game.undo_move()
+    assert game == original
+
+    # Move history doesn't take part in comparing games
+    game.apply_move(0, 6, 2, 5)  # g1-f3
+    game.apply_move(7, 6, 5, 5)  # g8-f6
+    game.apply_move(2, 5, 0, 6)  # f3-g1
+    game.apply_move(5, 5, 7, 6)  # f6-g8
+    original.halfmove_counter = 4
+    original.fullmove_counter = 3
+    assert game == original
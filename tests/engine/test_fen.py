@@ -1,14 +1,46 @@
 import pytest
 
+from src.engine.chess import (
+    ALL_CASTLING_RIGHTS,
+    BLACK_KINGSIDE,
+    BLACK_QUEENSIDE,
+    WHITE_KINGSIDE,
+    WHITE_QUEENSIDE,
+)
 from src.engine.fen import (
     FEN_PIECETYPE_MAP,
+    STARTING_FEN_SHORT,
     InvalidFENError,
     board_from_fen,
     game_from_fen,
     is_valid_fen,
+    is_valid_placement_fen,
     piece_from_fen,
 )
-from src.engine.piece import PieceColor, PieceType
+from src.engine.piece import PieceColor
+
+
+@pytest.mark.parametrize(
+    "fen,expected",
+    [
+        ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR", True),  # starting position
+        ("8/8/8/8/8/8/8/8", True),  # empty board
+        ("4k3/8/8/8/8/8/8/4K3", True),  # kings only
+        ("r3k2r/8/8/3pP3/8/8/8/R3K2R", True),  # mixed pieces and digits
+        ("8/8/8/8/8/8/8", False),  # only 7 rows
+        ("8/8/8/8/8/8/8/8/8", False),  # 9 rows
+        ("8/8/8/8/8/8/8/", False),  # empty 8th row
+        ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPP/RNBQKBNR", False),  # short row
+        ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPPP/RNBQKBNR", False),  # long row
+        ("8/8/8/8/8/8/8/7X", False),  # invalid piece char
+        ("8/8/8/8/8/8/8/9", False),  # invalid digit
+        ("8/8/8/8/8/8/8/08", False),  # zero is not a valid digit
+        ("8/8/8/8 8/8/8/8", False),  # whitespace
+        ("", False),  # empty string
+    ],
+)
+def test_is_valid_placement_fen(fen, expected):
+    assert is_valid_placement_fen(fen) == expected
 
 
 @pytest.mark.parametrize(
@@ -40,6 +72,11 @@ def test_valid_fens(fen):
         "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq z9 0 1",  # invalid en passant square
         "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - -1 1",  # negative halfmove
         "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 -5",  # negative fullmove
+        "invalid",  # not a FEN at all
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq -",  # missing counters
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0",  # missing fullmove
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkx - 0 1",  # invalid castling flag
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq e9 0 1",  # en passant off board
     ],
 )
 def test_invalid_format_fens(fen):
@@ -86,76 +123,80 @@ def test_invalid_en_passant(fen):
 
 
 def test_piece_from_fen():
-    valid_fens = "prnbqkPRNBQK"
-    for symbol in valid_fens:
-        p = piece_from_fen(symbol)
-        expected_color = PieceColor.WHITE if symbol.isupper() else PieceColor.BLACK
-        assert p.color == expected_color
-        expected_type = FEN_PIECETYPE_MAP[symbol.lower()]
-        assert p.type == expected_type
-
-    invalid_fens = ("$", "", "pK")
-    for symbol in invalid_fens:
-        with pytest.raises(InvalidFENError):
-            p = piece_from_fen(symbol)
-
-
-def test_board_from_fen():
-    # Test empty board
-    empty_fen = "8/8/8/8/8/8/8/8"
-    empty_board = board_from_fen(empty_fen)
-    for row in range(8):
-        for col in range(8):
-            assert empty_board.get_square(row, col) is None
-
-    # Test starting position
-    start_fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR"
-    start_board = board_from_fen(start_fen)
-
-    # Check black back rank
-    back_rank = "rnbqkbnr"
-    for col, symbol in enumerate(back_rank):
-        piece = start_board.get_square(7, col)
-        assert piece is not None
-        assert piece.color == PieceColor.BLACK
-        assert piece.type == FEN_PIECETYPE_MAP[symbol.lower()]
-
-    # Check black pawns
-    for col in range(8):
-        piece = start_board.get_square(6, col)
-        assert piece is not None
-        assert piece.color == PieceColor.BLACK
-        assert piece.type == PieceType.PAWN
-
-    # Check empty middle ranks
-    for row in range(2, 6):
-        for col in range(8):
-            assert start_board.get_square(row, col) is None
-
-    # Check white pawns
-    for col in range(8):
-        piece = start_board.get_square(1, col)
-        assert piece is not None
-        assert piece.color == PieceColor.WHITE
-        assert piece.type == PieceType.PAWN
-
-    # Check white back rank
-    back_rank = "RNBQKBNR"
-    for col, symbol in enumerate(back_rank):
-        piece = start_board.get_square(0, col)
-        assert piece is not None
-        assert piece.color == PieceColor.WHITE
-        assert piece.type == FEN_PIECETYPE_MAP[symbol.lower()]
+    symbols = "prnbqkPRNBQK"
+    expected = [
+        (
+            PieceColor.WHITE if symbol.isupper() else PieceColor.BLACK,
+            FEN_PIECETYPE_MAP[symbol.lower()],
+        )
+        for symbol in symbols
+    ]
+    pieces = [piece_from_fen(symbol) for symbol in symbols]
+    assert [(p.color, p.type) for p in pieces] == expected
+
+    # Pieces are interned, so parsing the same symbol again gives the same instance
+    assert all(piece_from_fen(symbol) is p for symbol, p in zip(symbols, pieces))
+
+
+@pytest.mark.parametrize("symbol", ["$", "", "pK"])
+def test_invalid_piece_from_fen(symbol):
+    with pytest.raises(InvalidFENError):
+        piece_from_fen(symbol)
+
+
+EMPTY_SNAPSHOT = (None,) * 64
+START_SNAPSHOT = (
+    tuple(piece_from_fen(symbol) for symbol in "RNBQKBNR")
+    + (piece_from_fen("P"),) * 8
+    + (None,) * 32
+    + (piece_from_fen("p"),) * 8
+    + tuple(piece_from_fen(symbol) for symbol in "rnbqkbnr")
+)
+
+
+@pytest.fixture(scope="module")
+def empty_board():
+    return board_from_fen("8/8/8/8/8/8/8/8")
+
+
+@pytest.fixture(scope="module")
+def start_board():
+    return board_from_fen(STARTING_FEN_SHORT)
+
+
+def test_board_from_fen_empty(empty_board):
+    assert empty_board.as_tuple() == EMPTY_SNAPSHOT
+    assert (empty_board.occ_w, empty_board.occ_b) == (0, 0)
+
+
+def test_board_from_fen_start(start_board):
+    assert start_board.as_tuple() == START_SNAPSHOT
+    # Ranks 1-2 are white and ranks 7-8 are black
+    assert (start_board.occ_w, start_board.occ_b) == (0xFFFF, 0xFFFF << 48)
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "8/8/8/8/8/8/8/7x",  # unknown symbol
+        "8/8/8/8/8/8/8/7é",  # non-ASCII symbol
+        "8/8/8/8/8/8/8",  # only 7 rows
+        "8/8/8/8/8/8/8/8/8",  # 9 rows
+        "8/8/8/8/8/8/8/9",  # invalid digit
+        "8/8/8/8/8/8/7/8",  # short row
+        "8/8/8/8/8/8/8/8K",  # long row
+    ],
+)
+def test_invalid_board_from_fen(fen):
+    with pytest.raises(InvalidFENError):
+        board_from_fen(fen)
 
 
 def test_game_from_fen():
     # Test initial position
     start_fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
     game = game_from_fen(start_fen)
-    assert game.white_castle_kingside is True
-    assert game.white_castle_queenside is True
-    assert game.black_castle_kingside is True
-    assert game.black_castle_queenside is True
+    assert game.castling_rights == ALL_CASTLING_RIGHTS
     assert game.en_passant_square is None
     assert game.halfmove_counter == 0
     assert game.fullmove_counter == 1
@@ -163,10 +204,9 @@ def test_game_from_fen():
     # Test position with specific castling rights and en passant
     mid_game_fen = "rnbq1rk1/ppp2ppp/3b1n2/3p4/3P4/2N1PN2/PPP1BPPP/R3K2R b KQ e3 2 8"
     game = game_from_fen(mid_game_fen)
-    assert game.white_castle_kingside is True
-    assert game.white_castle_queenside is True
-    assert game.black_castle_kingside is False
-    assert game.black_castle_queenside is False
+    assert game.castling_rights == WHITE_KINGSIDE | WHITE_QUEENSIDE
+    assert not game.castling_rights & BLACK_KINGSIDE
+    assert not game.castling_rights & BLACK_QUEENSIDE
     assert game.en_passant_square == (2, 4)  # e3 square
     assert game.halfmove_counter == 2
     assert game.fullmove_counter == 8
@@ -174,23 +214,13 @@ def test_game_from_fen():
     # Test position with no castling rights
     endgame_fen = "4k3/8/8/8/8/8/8/4K3 w - - 10 50"
     game = game_from_fen(endgame_fen)
-    assert game.white_castle_kingside is False
-    assert game.white_castle_queenside is False
-    assert game.black_castle_kingside is False
-    assert game.black_castle_queenside is False
+    assert game.castling_rights == 0
     assert game.en_passant_square is None
     assert game.halfmove_counter == 10
     assert game.fullmove_counter == 50
 
-    # Test invalid FENs
-    invalid_fens = [
-        "invalid",  # Not a valid FEN
-        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq -",  # Missing fields
-        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0",  # Missing fullmove
-        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkx - 0 1",  # Invalid castling
-        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq e9 0 1",  # Invalid en passant
-    ]
 
-    for fen in invalid_fens:
-        with pytest.raises(InvalidFENError):
-            game_from_fen(fen)
+def test_invalid_game_from_fen():
+    # The invalid cases themselves are covered by test_invalid_format_fens
+    with pytest.raises(InvalidFENError):
+        game_from_fen("invalid")
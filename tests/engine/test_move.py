@@ -3,22 +3,24 @@ import pytest
 from src.engine.move import (
     NotationError,
     index_to_squarename,
-    is_valid_square,
     is_valid_squarename,
     squarename_to_index,
 )
 
+ALL_SQUARENAMES = {
+    f"{letter}{number}" for letter in "abcdefgh" for number in "12345678"
+}
+
 
 def test_is_valid_squarename():
     # Test all possible valid squares (and ensure case insensitivity)
-    for letter in "aBcDeFgH":
-        for number in "12345678":
-            assert is_valid_squarename(letter + number), (
-                f"Square {letter}{number} should be valid"
-            )
+    all_cased = ALL_SQUARENAMES | {name.upper() for name in ALL_SQUARENAMES}
+    assert {name for name in all_cased if is_valid_squarename(name)} == all_cased
+
 
-    # Test invalid squares
-    invalid_squares = [
+@pytest.mark.parametrize(
+    "square",
+    [
         "1a",  # wrong order
         "11",  # no letter
         "a",  # too short
@@ -32,10 +34,10 @@ def test_is_valid_squarename():
         "a1b",  # too long
         " a1",  # leading space
         "a1 ",  # trailing space
-    ]
-
-    for square in invalid_squares:
-        assert not is_valid_squarename(square), f"Square '{square}' should be invalid"
+    ],
+)
+def test_invalid_squarename(square):
+    assert not is_valid_squarename(square)
 
 
 def test_squarename_to_index():
@@ -1,14 +1,27 @@
+import pytest
+
 from src.engine.fen import piece_from_fen
-from src.engine.piece import Piece, PieceType
+from src.engine.piece import CODE_PIECES, EMPTY, WHITE_KING, Piece
 
 FEN_SYMBOLS = "prnbqkPRNBQK"
 
 
 def test_is_king():
     pieces = [piece_from_fen(sym) for sym in FEN_SYMBOLS]
-    for piece in pieces:
-        if piece.type == PieceType.KING:
-            assert piece.is_king()
-        else:
-            assert not piece.is_king()
-        assert not piece.has_moved
+    assert [piece.is_king() for piece in pieces] == [sym in "kK" for sym in FEN_SYMBOLS]
+
+
+def test_piece_codes():
+    codes = [piece_from_fen(sym).code for sym in FEN_SYMBOLS]
+    assert EMPTY not in codes
+    assert sorted(codes) == list(range(1, len(CODE_PIECES) + 1))
+    assert piece_from_fen("K").code == WHITE_KING
+    for code in codes:
+        assert Piece.from_code(code).code == code
+        # Pieces for the same code are shared
+        assert Piece.from_code(code) is Piece.from_code(code)
+
+    # EMPTY and out-of-range codes are not pieces
+    for code in (EMPTY, -1, len(CODE_PIECES) + 1):
+        with pytest.raises(ValueError):
+            Piece.from_code(code)